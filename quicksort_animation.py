@@ -13,8 +13,18 @@ Run:
 Change ARRAY in test_arrays.py — both quicksort.py and this animation update.
 """
 
-from manim import *
+try:
+    from manim import *
+except ImportError:
+    # record_events and the event types are plain Python — keep them
+    # importable (e.g. for quick correctness checks of the recorded swap
+    # sequence) on machines without manim; only rendering needs it
+    Scene = object
 import sys, os
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_arrays import ARRAY
@@ -27,7 +37,32 @@ COL_SWAP = "#FF6B35"
 COL_SORTED = "#4CAF50"
 
 
+@lru_cache(maxsize=512)
+def _text(msg, size, col, weight="NORMAL"):
+    # Text layout (Pango) is expensive — build each unique string once and
+    # hand out copies; status messages and number labels repeat a lot
+    return Text(msg, font_size=size, color=col, weight=weight)
+
+
 # ── record every quicksort event (plain Python, no Manim) ─────────────────────
+
+BLOCK = 4  # compare outcomes are buffered and flushed in blocks of this size
+
+# preview mode: runs of compares that cause no swap collapse into a single
+# sweep event (one Indicate pulse) instead of tint/restore per block —
+# much faster renders at the cost of per-compare fidelity
+PREVIEW = True
+
+# one namedtuple per event kind — attribute access instead of per-field dict
+# hashing, and the replay loop dispatches on the event's type
+Pivot = namedtuple("Pivot", "lo hi pivot_idx msg")
+BlockCompare = namedtuple("BlockCompare", "lo hi pivot_idx js msg")
+Sweep = namedtuple("Sweep", "lo hi pivot_idx js msg")
+Swap = namedtuple("Swap", "lo hi pivot_idx a b msg")
+SortedIdx = namedtuple("SortedIdx", "lo hi idx msg")
+Done = namedtuple("Done", "msg")
+
+
 def record_events(original):
     """
     Simulate quicksort and record every decision as an event.
@@ -36,83 +71,109 @@ def record_events(original):
     the simulation and the visual representation start identical and stay
     in sync through the at_pos / slot maps in the scene.
     """
-    data = original[:]
+    # the simulation only swaps and compares — a contiguous int64 array does
+    # both without per-element object churn, and np.int64 formats like int
+    # in the event messages
+    data = np.asarray(original, dtype=np.int64).copy()
+    # events carry only the indices/message the replay needs — the scene
+    # reconstructs array state through its at_pos / slot maps, so no
+    # per-event snapshot of the data is taken
     events = []
-    sorted_set = set()
-
-    def push(kind, **kw):
-        events.append({"kind": kind, "data": data[:], **kw})
 
     def partition(lo, hi):
         pivot = data[hi]
-        push("pivot", lo=lo, hi=hi, pivot_idx=hi, msg=f"Pivot = {pivot}  (index {hi})")
+        events.append(Pivot(lo, hi, hi, f"Pivot = {pivot}  (index {hi})"))
 
+        # BlockLomuto: scan up to BLOCK elements and buffer which ones beat
+        # the pivot before anything moves — one batched compare event per
+        # block instead of one per element
         i = lo - 1
-        for j in range(lo, hi):
-            push(
-                "compare",
-                lo=lo,
-                hi=hi,
-                pivot_idx=hi,
-                j=j,
-                msg=f"Is  {data[j]}  <  pivot {pivot} ?",
-            )
-            if data[j] < pivot:
+        j = lo
+        last_clean = False  # previous block produced no winners
+        nonswaps = []  # PREVIEW: failed compares pending in the current sweep
+
+        def flush_sweep():
+            if nonswaps:
+                events.append(
+                    Sweep(
+                        lo,
+                        hi,
+                        hi,
+                        nonswaps[:],
+                        f"{len(nonswaps)} element(s) stay put — not below pivot {pivot}",
+                    )
+                )
+                nonswaps.clear()
+
+        while j < hi:
+            b = min(BLOCK, hi - j)
+            offsets = [c for c in range(b) if data[j + c] < pivot]
+            if PREVIEW:
+                # winners are shown by their swap; losers join the sweep
+                nonswaps.extend(j + c for c in range(b) if c not in offsets)
+            elif not offsets and last_clean:
+                # back-to-back all-loser blocks: extend the previous compare
+                # event instead of emitting another tint/restore round trip
+                prev = events[-1]
+                prev.js.extend(range(j, j + b))
+                events[-1] = prev._replace(
+                    msg=f"None of  {[int(data[s]) for s in prev.js]}  <  pivot {pivot}"
+                )
+            else:
+                events.append(
+                    BlockCompare(
+                        lo,
+                        hi,
+                        hi,
+                        list(range(j, j + b)),
+                        f"Which of  {[int(data[j + c]) for c in range(b)]}  <  pivot {pivot} ?",
+                    )
+                )
+            last_clean = not offsets
+            # the buffered swaps still apply one pair at a time — successive
+            # pairs can share a slot, so they can't collapse into one event;
+            # equal-value pairs are skipped outright, the picture wouldn't change
+            for c in offsets:
                 i += 1
-                if i != j:
-                    push(
-                        "swap",
-                        lo=lo,
-                        hi=hi,
-                        pivot_idx=hi,
-                        a=i,
-                        b=j,
-                        msg=f"Swap  {data[i]}  ↔  {data[j]}",
+                if i != j + c and data[i] != data[j + c]:
+                    flush_sweep()  # pending sweep slots still match at_pos here
+                    events.append(
+                        Swap(lo, hi, hi, i, j + c, f"Swap  {data[i]}  ↔  {data[j + c]}")
                     )
-                    data[i], data[j] = data[j], data[i]
+                    data[i], data[j + c] = data[j + c], data[i]
+            j += b
+        flush_sweep()
 
         pi = i + 1
+        # note: the pivot-placement swap is kept even for equal values — the
+        # orange pivot box has to travel to pi so sorted_idx turns it green
         if pi != hi:
-            push(
-                "swap",
-                lo=lo,
-                hi=hi,
-                pivot_idx=hi,
-                a=pi,
-                b=hi,
-                msg=f"Place pivot {data[hi]} → index {pi}",
+            events.append(
+                Swap(lo, hi, hi, pi, hi, f"Place pivot {data[hi]} → index {pi}")
             )
             data[pi], data[hi] = data[hi], data[pi]
 
-        sorted_set.add(pi)
-        push(
-            "sorted_idx",
-            lo=lo,
-            hi=hi,
-            idx=pi,
-            sorted_set=sorted_set.copy(),
-            msg=f"{data[pi]}  is in its final position ✓",
-        )
+        # only the newly settled index — already-green boxes need no event
+        events.append(SortedIdx(lo, hi, pi, f"{data[pi]}  is in its final position ✓"))
         return pi
 
-    def qs(lo, hi):
+    # iterative driver — explicit (lo, hi) stack instead of recursion, so no
+    # Python frame per subproblem and no recursion-limit risk on adversarial
+    # inputs; the right half is pushed first so the left half pops next,
+    # preserving the recursive event order exactly
+    stack = [(0, len(data) - 1)]
+    while stack:
+        lo, hi = stack.pop()
         if lo < hi:
             pi = partition(lo, hi)
-            qs(lo, pi - 1)
-            qs(pi + 1, hi)
+            stack.append((pi + 1, hi))
+            stack.append((lo, pi - 1))
         elif lo == hi:
-            sorted_set.add(lo)
-            push(
-                "sorted_idx",
-                lo=lo,
-                hi=hi,
-                idx=lo,
-                sorted_set=sorted_set.copy(),
-                msg=f"Single element  {data[lo]}  is already sorted ✓",
+            events.append(
+                SortedIdx(lo, hi, lo, f"Single element  {data[lo]}  is already sorted ✓")
             )
 
-    qs(0, len(data) - 1)
-    push("done", sorted_set=sorted_set.copy(), msg="✓  Array sorted!")
+    events.append(Done("✓  Array sorted!"))
     return events
 
 
@@ -128,12 +189,13 @@ class QuickSortScene(Scene):
         Y = 0.3
         x0 = -(n - 1) * GAP / 2
 
-        def slot_x(s):
-            return x0 + s * GAP
+        # x centre of every screen slot, computed once
+        slot_xs = [x0 + s * GAP for s in range(n)]
 
         # ── KEY DATA STRUCTURES ───────────────────────────────────────────────
         #
-        #  boxes[i] / num_labels[i]  →  the Square/Text for original value arr[i]
+        #  cells[i] / boxes[i]  →  the VGroup(Square, Text) / bare Square
+        #                          for original value arr[i]
         #  slot[i]   = which screen position (0..n-1) value i currently sits at
         #  at_pos[s] = which value index is currently at screen position s
         #
@@ -143,8 +205,11 @@ class QuickSortScene(Scene):
         slot = list(range(n))  # slot[val_idx]  = current screen pos
         at_pos = list(range(n))  # at_pos[screen] = current val_idx
 
+        # cells[i] = VGroup(box, label) — one mobject per slot to move around;
+        # boxes[i] keeps a handle on the square alone so fills never touch
+        # the white label glyphs
+        cells = []
         boxes = []
-        num_labels = []
         for i, v in enumerate(arr):
             sq = Square(
                 side_length=BOX,
@@ -153,19 +218,26 @@ class QuickSortScene(Scene):
                 fill_opacity=1,
                 stroke_width=2,
             )
-            sq.move_to([slot_x(i), Y, 0])
+            sq.move_to([slot_xs[i], Y, 0])
 
-            lb = Text(str(v), font_size=int(BOX * 40), color=WHITE, weight=BOLD)
+            lb = _text(str(v), int(BOX * 40), WHITE, weight=BOLD).copy()
             lb.move_to(sq.get_center())
 
+            cells.append(VGroup(sq, lb))
             boxes.append(sq)
-            num_labels.append(lb)
+
+        # fills are driven by one updater per box reading target_color — a
+        # recolour is then a plain list write plus a wait, with no Animation
+        # objects built or interpolated
+        target_color = [COL_DEFAULT] * n
+        for i, sq in enumerate(boxes):
+            sq.add_updater(lambda m, i=i: m.set_fill(target_color[i], opacity=1))
 
         # small index labels below slots
         idx_labels = []
         for s in range(n):
-            t = Text(str(s), font_size=14, color=GRAY)
-            t.move_to([slot_x(s), Y - BOX / 2 - 0.25, 0])
+            t = _text(str(s), 14, GRAY).copy()
+            t.move_to([slot_xs[s], Y - BOX / 2 - 0.25, 0])
             idx_labels.append(t)
 
         # title
@@ -175,7 +247,7 @@ class QuickSortScene(Scene):
         # legend
         def leg_item(col, txt):
             sq = Square(0.2, fill_color=col, fill_opacity=1, stroke_width=0)
-            t = Text(txt, font_size=15, color=WHITE)
+            t = _text(txt, 15, WHITE).copy()
             t.next_to(sq, RIGHT, buff=0.08)
             return VGroup(sq, t)
 
@@ -191,40 +263,51 @@ class QuickSortScene(Scene):
         status_mob = Text("", font_size=21, color=YELLOW)
         status_mob.to_edge(DOWN, buff=0.4)
 
-        self.add(title, legend, *boxes, *num_labels, *idx_labels, status_mob)
+        self.add(title, legend, *cells, *idx_labels, status_mob)
         self.wait(0.4)
 
         # ── helpers ───────────────────────────────────────────────────────────
 
-        def recolour(val_idx, col, rt=0.22):
-            self.play(boxes[val_idx].animate.set_fill(col, opacity=1), run_time=rt)
-
-        def recolour_now(val_idx, col):
-            boxes[val_idx].set_fill(col, opacity=1)
+        def recolour(val_idx, col):
+            # state write — the box's updater applies it on the next frame
+            target_color[val_idx] = col
 
         def update_status(msg, col=YELLOW):
-            nonlocal status_mob
-            new = Text(msg, font_size=21, color=col)
+            # morph the one persistent Text in place — no FadeOut/FadeIn pair
+            # and no fresh Pango layout for repeated messages
+            new = _text(msg, 21, col).copy()
             new.to_edge(DOWN, buff=0.4)
-            self.play(FadeOut(status_mob), FadeIn(new), run_time=0.18)
-            status_mob = new
+            status_mob.become(new)
+            self.wait(0.1)
+
+        @lru_cache(maxsize=None)
+        def _arc(sa, sb):
+            # slot positions are fixed, so the arc between two slots never
+            # changes — tessellate each (sa, sb) pair once and copy
+            return ArcBetweenPoints(
+                [slot_xs[sa], Y, 0], [slot_xs[sb], Y, 0], angle=PI / 2.8
+            )
 
         def do_swap(va, vb):
             """Animate boxes for value-indices va and vb swapping screen slots."""
             sa, sb = slot[va], slot[vb]
-            path_a = ArcBetweenPoints(
-                [slot_x(sa), Y, 0], [slot_x(sb), Y, 0], angle=PI / 2.8
-            )
-            path_b = ArcBetweenPoints(
-                [slot_x(sb), Y, 0], [slot_x(sa), Y, 0], angle=PI / 2.8
-            )
-            self.play(
-                MoveAlongPath(boxes[va], path_a),
-                MoveAlongPath(num_labels[va], path_a),
-                MoveAlongPath(boxes[vb], path_b),
-                MoveAlongPath(num_labels[vb], path_b),
-                run_time=0.75,
-            )
+            if abs(sa - sb) <= 1:
+                # neighbours: a straight slide reads fine and skips building
+                # and tessellating two Bezier arcs
+                self.play(
+                    cells[va].animate.move_to([slot_xs[sb], Y, 0]),
+                    cells[vb].animate.move_to([slot_xs[sa], Y, 0]),
+                    run_time=0.5,
+                )
+            else:
+                # long hops keep the arc — easier to track visually
+                path_a = _arc(sa, sb).copy()
+                path_b = _arc(sb, sa).copy()
+                self.play(
+                    MoveAlongPath(cells[va], path_a),
+                    MoveAlongPath(cells[vb], path_b),
+                    run_time=0.75,
+                )
             # keep maps in sync
             slot[va], slot[vb] = sb, sa
             at_pos[sb], at_pos[sa] = va, vb
@@ -236,37 +319,48 @@ class QuickSortScene(Scene):
         current_pivot_val = None
 
         for ev in events:
-            kind = ev["kind"]
+            kind = type(ev)
 
             # ── new partition call: highlight pivot, reset sub-array ───────────
-            if kind == "pivot":
-                lo, hi = ev["lo"], ev["hi"]
-                pivot_slot = ev["pivot_idx"]  # screen slot = hi
+            if kind is Pivot:
+                lo, hi = ev.lo, ev.hi
+                pivot_slot = ev.pivot_idx  # screen slot = hi
                 current_pivot_val = at_pos[pivot_slot]
 
                 for s in range(lo, hi + 1):
-                    vi = at_pos[s]
-                    recolour_now(vi, COL_DEFAULT)
+                    recolour(at_pos[s], COL_DEFAULT)
 
-                update_status(ev["msg"])
+                update_status(ev.msg)
                 recolour(current_pivot_val, COL_PIVOT)
-
-            # ── compare element j against pivot ───────────────────────────────
-            elif kind == "compare":
-                j_val = at_pos[ev["j"]]
-                update_status(ev["msg"])
-                recolour(j_val, COL_COMPARE)
-                self.wait(0.2)
-                if j_val != current_pivot_val:
-                    recolour(j_val, COL_DEFAULT)
+                self.wait(0.22)
+
+            # ── compare a block of elements against the pivot ─────────────────
+            elif kind is BlockCompare:
+                vals = [at_pos[s] for s in ev.js]  # never contains the pivot
+                update_status(ev.msg)
+                for v in vals:
+                    recolour(v, COL_COMPARE)
+                self.wait(0.4)
+                for v in vals:
+                    recolour(v, COL_DEFAULT)
+                self.wait(0.22)
+
+            # ── preview: one pulse over elements that stayed put ──────────────
+            elif kind is Sweep:
+                update_status(ev.msg)
+                self.play(
+                    *[Indicate(boxes[at_pos[s]], color=COL_COMPARE) for s in ev.js],
+                    run_time=0.35,
+                )
 
             # ── swap elements at screen slots a and b ─────────────────────────
-            elif kind == "swap":
-                va = at_pos[ev["a"]]
-                vb = at_pos[ev["b"]]
-                update_status(ev["msg"], col=COL_SWAP)
+            elif kind is Swap:
+                va = at_pos[ev.a]
+                vb = at_pos[ev.b]
+                update_status(ev.msg, col=COL_SWAP)
                 recolour(va, COL_SWAP)
                 recolour(vb, COL_SWAP)
+                self.wait(0.22)
 
                 # remember which val is the pivot BEFORE the move
                 pivot_is_va = va == current_pivot_val
@@ -276,31 +370,24 @@ class QuickSortScene(Scene):
 
                 # restore colours: pivot keeps its colour, other goes default
                 if pivot_is_va:
-                    recolour(va, COL_PIVOT, rt=0.18)
-                    recolour(vb, COL_DEFAULT, rt=0.18)
+                    restore = ((va, COL_PIVOT), (vb, COL_DEFAULT))
                 elif pivot_is_vb:
-                    recolour(vb, COL_PIVOT, rt=0.18)
-                    recolour(va, COL_DEFAULT, rt=0.18)
+                    restore = ((vb, COL_PIVOT), (va, COL_DEFAULT))
                 else:
-                    recolour(va, COL_DEFAULT, rt=0.18)
-                    recolour(vb, COL_DEFAULT, rt=0.18)
+                    restore = ((va, COL_DEFAULT), (vb, COL_DEFAULT))
+                for v, c in restore:
+                    recolour(v, c)
+                self.wait(0.18)
 
             # ── mark confirmed sorted positions green ─────────────────────────
-            elif kind == "sorted_idx":
-                update_status(ev["msg"], col=COL_SORTED)
-                anims = [
-                    boxes[at_pos[s]].animate.set_fill(COL_SORTED, opacity=1)
-                    for s in ev["sorted_set"]
-                ]
-                if anims:
-                    self.play(*anims, run_time=0.4)
-                self.wait(0.25)
+            elif kind is SortedIdx:
+                update_status(ev.msg, col=COL_SORTED)
+                recolour(at_pos[ev.idx], COL_SORTED)
+                self.wait(0.65)
 
             # ── final frame ───────────────────────────────────────────────────
-            elif kind == "done":
-                update_status(ev["msg"], col=GREEN)
-                self.play(
-                    *[b.animate.set_fill(COL_SORTED, opacity=1) for b in boxes],
-                    run_time=0.6,
-                )
+            elif kind is Done:
+                update_status(ev.msg, col=GREEN)
+                for v in range(n):
+                    recolour(v, COL_SORTED)
                 self.wait(2)